@@ -8,14 +8,21 @@ This script evaluates APT variants (C1-C6) against ground truth samples using th
 3. Same Objective (SO) [Yes/No]: Objective alignment with ground truth
 """
 
+import numpy as np
 import pandas as pd
+import os
 import re
 import sys
 import argparse
 import logging
-from typing import Dict, List, Tuple
-import warnings
-warnings.filterwarnings('ignore')
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, List, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; scoring falls back to NumPy
+    njit = None
 
 # Configure logging
 logging.basicConfig(
@@ -41,107 +48,154 @@ TACTIC_ORDER = {
     'impact': 13
 }
 
-# Technique to Tactic Mapping (simplified - common mappings)
+# Techniques per tactic (simplified - common mappings)
 # NOTE: Some techniques appear in multiple tactics in MITRE ATT&CK (e.g., T1053, T1078)
-# When duplicates exist, the last mapping represents the primary/most common use case
+# and are listed under each of them here. TECHNIQUE_TACTIC_MAP below assigns each
+# technique a single tactic: tactics are applied in kill-chain order and the last
+# one wins, i.e. the latest kill-chain stage represents the primary/most common use case.
 # This is a simplification for scoring purposes and provides consistent evaluation
-TECHNIQUE_TACTIC_MAP = {
-    # Reconnaissance
-    'T1595': 'reconnaissance', 'T1594': 'reconnaissance', 'T1593': 'reconnaissance',
-    'T1592': 'reconnaissance', 'T1590': 'reconnaissance', 'T1591': 'reconnaissance',
-    'T1589': 'reconnaissance', 'T1598': 'reconnaissance',
-    
-    # Resource Development
-    'T1583': 'resource-development', 'T1586': 'resource-development', 'T1584': 'resource-development',
-    'T1587': 'resource-development', 'T1585': 'resource-development', 'T1588': 'resource-development',
-    
-    # Initial Access
-    'T1189': 'initial-access', 'T1190': 'initial-access', 'T1133': 'initial-access',
-    'T1200': 'initial-access', 'T1566': 'initial-access', 'T1091': 'initial-access',
-    'T1195': 'initial-access', 'T1199': 'initial-access', 'T1078': 'initial-access',
-    
-    # Execution
-    'T1059': 'execution', 'T1106': 'execution', 'T1203': 'execution',
-    'T1559': 'execution', 'T1569': 'execution', 'T1204': 'execution',
-    'T1047': 'execution', 'T1053': 'execution', 'T1072': 'execution',
-    
-    # Persistence
-    'T1098': 'persistence', 'T1197': 'persistence', 'T1547': 'persistence',
-    'T1037': 'persistence', 'T1136': 'persistence', 'T1543': 'persistence',
-    'T1505': 'persistence', 'T1542': 'persistence', 'T1554': 'persistence',
-    'T1053': 'persistence', 'T1133': 'persistence', 'T1078': 'persistence',
-    
-    # Privilege Escalation
-    'T1134': 'privilege-escalation', 'T1548': 'privilege-escalation', 'T1547': 'privilege-escalation',
-    'T1037': 'privilege-escalation', 'T1543': 'privilege-escalation', 'T1068': 'privilege-escalation',
-    'T1574': 'privilege-escalation', 'T1055': 'privilege-escalation', 'T1053': 'privilege-escalation',
-    'T1078': 'privilege-escalation',
-    
-    # Defense Evasion
-    'T1548': 'defense-evasion', 'T1134': 'defense-evasion', 'T1197': 'defense-evasion',
-    'T1140': 'defense-evasion', 'T1480': 'defense-evasion', 'T1211': 'defense-evasion',
-    'T1222': 'defense-evasion', 'T1564': 'defense-evasion', 'T1574': 'defense-evasion',
-    'T1562': 'defense-evasion', 'T1070': 'defense-evasion', 'T1202': 'defense-evasion',
-    'T1036': 'defense-evasion', 'T1556': 'defense-evasion', 'T1578': 'defense-evasion',
-    'T1112': 'defense-evasion', 'T1027': 'defense-evasion', 'T1647': 'defense-evasion',
-    'T1055': 'defense-evasion', 'T1542': 'defense-evasion', 'T1620': 'defense-evasion',
-    'T1207': 'defense-evasion', 'T1218': 'defense-evasion', 'T1216': 'defense-evasion',
-    'T1553': 'defense-evasion', 'T1221': 'defense-evasion', 'T1205': 'defense-evasion',
-    'T1127': 'defense-evasion', 'T1535': 'defense-evasion', 'T1078': 'defense-evasion',
-    'T1497': 'defense-evasion', 'T1600': 'defense-evasion', 'T1601': 'defense-evasion',
-    
-    # Credential Access
-    'T1110': 'credential-access', 'T1555': 'credential-access', 'T1212': 'credential-access',
-    'T1187': 'credential-access', 'T1606': 'credential-access', 'T1056': 'credential-access',
-    'T1556': 'credential-access', 'T1111': 'credential-access', 'T1621': 'credential-access',
-    'T1040': 'credential-access', 'T1003': 'credential-access', 'T1528': 'credential-access',
-    'T1558': 'credential-access', 'T1539': 'credential-access',
-    
-    # Discovery
-    'T1087': 'discovery', 'T1010': 'discovery', 'T1217': 'discovery',
-    'T1580': 'discovery', 'T1538': 'discovery', 'T1526': 'discovery',
-    'T1482': 'discovery', 'T1083': 'discovery', 'T1615': 'discovery',
-    'T1046': 'discovery', 'T1135': 'discovery', 'T1040': 'discovery',
-    'T1201': 'discovery', 'T1120': 'discovery', 'T1069': 'discovery',
-    'T1057': 'discovery', 'T1012': 'discovery', 'T1018': 'discovery',
-    'T1518': 'discovery', 'T1082': 'discovery', 'T1614': 'discovery',
-    'T1016': 'discovery', 'T1049': 'discovery', 'T1033': 'discovery',
-    'T1007': 'discovery', 'T1124': 'discovery', 'T1497': 'discovery',
-    'T1622': 'discovery',
-    
-    # Lateral Movement
-    'T1210': 'lateral-movement', 'T1534': 'lateral-movement', 'T1570': 'lateral-movement',
-    'T1563': 'lateral-movement', 'T1021': 'lateral-movement', 'T1091': 'lateral-movement',
-    'T1072': 'lateral-movement', 'T1080': 'lateral-movement', 'T1550': 'lateral-movement',
-    
-    # Collection
-    'T1560': 'collection', 'T1123': 'collection', 'T1119': 'collection',
-    'T1185': 'collection', 'T1115': 'collection', 'T1530': 'collection',
-    'T1602': 'collection', 'T1213': 'collection', 'T1005': 'collection',
-    'T1039': 'collection', 'T1025': 'collection', 'T1074': 'collection',
-    'T1114': 'collection', 'T1113': 'collection', 'T1125': 'collection',
-    
-    # Command and Control
-    'T1071': 'command-and-control', 'T1092': 'command-and-control', 'T1132': 'command-and-control',
-    'T1001': 'command-and-control', 'T1568': 'command-and-control', 'T1573': 'command-and-control',
-    'T1008': 'command-and-control', 'T1105': 'command-and-control', 'T1104': 'command-and-control',
-    'T1095': 'command-and-control', 'T1571': 'command-and-control', 'T1572': 'command-and-control',
-    'T1090': 'command-and-control', 'T1219': 'command-and-control', 'T1205': 'command-and-control',
-    'T1102': 'command-and-control',
-    
-    # Exfiltration
-    'T1020': 'exfiltration', 'T1030': 'exfiltration', 'T1048': 'exfiltration',
-    'T1041': 'exfiltration', 'T1011': 'exfiltration', 'T1052': 'exfiltration',
-    'T1567': 'exfiltration', 'T1029': 'exfiltration', 'T1537': 'exfiltration',
-    
-    # Impact
-    'T1531': 'impact', 'T1485': 'impact', 'T1486': 'impact',
-    'T1565': 'impact', 'T1491': 'impact', 'T1561': 'impact',
-    'T1499': 'impact', 'T1495': 'impact', 'T1490': 'impact',
-    'T1498': 'impact', 'T1496': 'impact', 'T1489': 'impact',
-    'T1529': 'impact',
+TACTIC_TECHNIQUES = {
+    'reconnaissance': [
+        'T1595', 'T1594', 'T1593', 'T1592', 'T1590', 'T1591',
+        'T1589', 'T1598',
+    ],
+    'resource-development': [
+        'T1583', 'T1586', 'T1584', 'T1587', 'T1585', 'T1588',
+    ],
+    'initial-access': [
+        'T1189', 'T1190', 'T1133', 'T1200', 'T1566', 'T1091',
+        'T1195', 'T1199', 'T1078',
+    ],
+    'execution': [
+        'T1059', 'T1106', 'T1203', 'T1559', 'T1569', 'T1204',
+        'T1047', 'T1053', 'T1072',
+    ],
+    'persistence': [
+        'T1098', 'T1197', 'T1547', 'T1037', 'T1136', 'T1543',
+        'T1505', 'T1542', 'T1554', 'T1053', 'T1133', 'T1078',
+    ],
+    'privilege-escalation': [
+        'T1134', 'T1548', 'T1547', 'T1037', 'T1543', 'T1068',
+        'T1574', 'T1055', 'T1053', 'T1078',
+    ],
+    'defense-evasion': [
+        'T1548', 'T1134', 'T1197', 'T1140', 'T1480', 'T1211',
+        'T1222', 'T1564', 'T1574', 'T1562', 'T1070', 'T1202',
+        'T1036', 'T1556', 'T1578', 'T1112', 'T1027', 'T1647',
+        'T1055', 'T1542', 'T1620', 'T1207', 'T1218', 'T1216',
+        'T1553', 'T1221', 'T1205', 'T1127', 'T1535', 'T1078',
+        'T1497', 'T1600', 'T1601',
+    ],
+    'credential-access': [
+        'T1110', 'T1555', 'T1212', 'T1187', 'T1606', 'T1056',
+        'T1556', 'T1111', 'T1621', 'T1040', 'T1003', 'T1528',
+        'T1558', 'T1539',
+    ],
+    'discovery': [
+        'T1087', 'T1010', 'T1217', 'T1580', 'T1538', 'T1526',
+        'T1482', 'T1083', 'T1615', 'T1046', 'T1135', 'T1040',
+        'T1201', 'T1120', 'T1069', 'T1057', 'T1012', 'T1018',
+        'T1518', 'T1082', 'T1614', 'T1016', 'T1049', 'T1033',
+        'T1007', 'T1124', 'T1497', 'T1622',
+    ],
+    'lateral-movement': [
+        'T1210', 'T1534', 'T1570', 'T1563', 'T1021', 'T1091',
+        'T1072', 'T1080', 'T1550',
+    ],
+    'collection': [
+        'T1560', 'T1123', 'T1119', 'T1185', 'T1115', 'T1530',
+        'T1602', 'T1213', 'T1005', 'T1039', 'T1025', 'T1074',
+        'T1114', 'T1113', 'T1125',
+    ],
+    'command-and-control': [
+        'T1071', 'T1092', 'T1132', 'T1001', 'T1568', 'T1573',
+        'T1008', 'T1105', 'T1104', 'T1095', 'T1571', 'T1572',
+        'T1090', 'T1219', 'T1205', 'T1102',
+    ],
+    'exfiltration': [
+        'T1020', 'T1030', 'T1048', 'T1041', 'T1011', 'T1052',
+        'T1567', 'T1029', 'T1537',
+    ],
+    'impact': [
+        'T1531', 'T1485', 'T1486', 'T1565', 'T1491', 'T1561',
+        'T1499', 'T1495', 'T1490', 'T1498', 'T1496', 'T1489',
+        'T1529',
+    ],
+}
+
+# Technique to Tactic Mapping (one tactic per technique, see note above)
+TECHNIQUE_TACTIC_MAP = {}
+for _tactic in sorted(TACTIC_TECHNIQUES, key=TACTIC_ORDER.__getitem__):
+    for _technique in TACTIC_TECHNIQUES[_tactic]:
+        TECHNIQUE_TACTIC_MAP[_technique] = _tactic
+del _tactic, _technique
+
+
+def _log_multi_tactic_techniques() -> None:
+    """Log techniques listed under more than one tactic and the tactic they resolve to."""
+    logger = logging.getLogger(__name__)
+    tactics_per_technique = {}
+    for tactic, techniques in TACTIC_TECHNIQUES.items():
+        for technique in techniques:
+            tactics_per_technique.setdefault(technique, []).append(tactic)
+    for technique, tactics in sorted(tactics_per_technique.items()):
+        if len(tactics) > 1:
+            logger.debug(f"{technique} is listed under {', '.join(tactics)}; scored as {TECHNIQUE_TACTIC_MAP[technique]}")
+
+
+# Intern tactic names so set membership checks can short-circuit on identity
+TACTIC_ORDER = {sys.intern(tactic): order for tactic, order in TACTIC_ORDER.items()}
+TECHNIQUE_TACTIC_MAP = {technique: sys.intern(tactic) for technique, tactic in TECHNIQUE_TACTIC_MAP.items()}
+
+# Kill-chain position of each technique, resolved once so scoring needs a single lookup
+TECHNIQUE_ORDER = {
+    technique: TACTIC_ORDER[tactic] for technique, tactic in TECHNIQUE_TACTIC_MAP.items()
 }
 
+# One bit per tactic so a sequence's set of tactics fits in a single integer
+TACTIC_BIT = {tactic: 1 << order for tactic, order in TACTIC_ORDER.items()}
+
+# Tactic bit combinations checked when scoring realism and inferring objectives
+_INITIAL_ACCESS_BITS = TACTIC_BIT['initial-access'] | TACTIC_BIT['reconnaissance']
+_EXECUTION_BIT = TACTIC_BIT['execution']
+_FOOTHOLD_BITS = TACTIC_BIT['command-and-control'] | TACTIC_BIT['persistence']
+_DATA_THEFT_BITS = TACTIC_BIT['collection'] | TACTIC_BIT['exfiltration']
+_CREDENTIAL_ACCESS_BIT = TACTIC_BIT['credential-access']
+_LATERAL_MOVEMENT_BIT = TACTIC_BIT['lateral-movement']
+_IMPACT_BIT = TACTIC_BIT['impact']
+
+# Dense arrays indexed by the technique number (T1566 -> 1566): kill-chain
+# order (-1 if unknown) and tactic bit (0 if unknown)
+_TACTIC_LUT = np.full(10000, -1, dtype=np.int8)
+_TACTIC_BIT_LUT = np.zeros(10000, dtype=np.uint16)
+for _technique, _order in TECHNIQUE_ORDER.items():
+    _TACTIC_LUT[int(_technique[1:])] = _order
+    _TACTIC_BIT_LUT[int(_technique[1:])] = 1 << _order
+del _technique, _order
+
+# Logical coherence cutoffs: violation ratios mapped to scores 10 (no violations) down to 2
+LC_VIOLATION_CUTOFFS = np.array([0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.7, 0.85])
+LC_SCORES = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Minimum number of rows before scoring is spread across worker processes;
+# below this, process pool startup costs more than it saves
+PARALLEL_MIN_ROWS = 500
+
+# Log scoring progress every this many rows instead of per row or candidate
+PROGRESS_INTERVAL = 1000
+
+# Column dtypes for flattened CSV input: APT/variant names repeat, sequences are text
+CSV_DTYPES = {
+    'apt': 'category',
+    'variant': 'category',
+    'seed_set': 'string',
+    'seed_set_enriched': 'string',
+    **{f'C{i}_enriched': 'string' for i in range(1, 7)},
+}
+
+# MITRE ATT&CK technique ID pattern (e.g. T1566 or T1566.001)
+_TECH_RE = re.compile(r'T\d{4}(?:\.\d{3})?')
+
 # APT Objectives
 APT_OBJECTIVES = {
     'APT41': ['espionage', 'financial-gain'],
@@ -166,88 +220,162 @@ APT_OBJECTIVES = {
 }
 
 
+def _interned_set(values) -> FrozenSet[str]:
+    """Build a frozenset of interned strings."""
+    return frozenset(sys.intern(v) for v in values)
+
+
+APT_OBJECTIVES = {apt: _interned_set(objectives) for apt, objectives in APT_OBJECTIVES.items()}
+DEFAULT_APT_OBJECTIVES = _interned_set({'espionage'})
+
+# APTs known for destructive operations, where impact without data theft is realistic
+DESTRUCTIVE_APTS = frozenset({'Sandworm_Team', 'Wizard_Spider', 'Lazarus_Group'})
+
+# Objectives that are compatible with each other (e.g., espionage and credential-theft)
+_COMPATIBLE_GROUPS = (
+    _interned_set({'espionage', 'credential-theft', 'credential-harvesting'}),
+    _interned_set({'financial-gain', 'financial-theft', 'credential-theft'}),
+    _interned_set({'disruption', 'ransomware', 'ics-disruption'}),
+)
+
+
 def extract_techniques(sequence: str) -> List[str]:
     """Extract technique IDs from a sequence string."""
-    if pd.isna(sequence) or sequence == '':
-        return []
+    # Extract all T#### patterns ('' from evaluate_candidates gives [])
+    if isinstance(sequence, str):
+        return _TECH_RE.findall(sequence)
     
-    # Extract all T#### patterns
-    techniques = re.findall(r'T\d{4}(?:\.\d{3})?', str(sequence))
-    return techniques
+    # Missing cells from direct callers: None, NaN or pd.NA
+    if sequence is None or pd.isna(sequence):
+        return []
+    return _TECH_RE.findall(str(sequence))
 
 
 def get_tactic_for_technique(technique: str) -> str:
     """Get the tactic for a technique ID."""
     # Strip sub-technique notation
-    base_technique = technique.split('.')[0]
+    base_technique = technique.partition('.')[0]
     return TECHNIQUE_TACTIC_MAP.get(base_technique, 'unknown')
 
 
-def evaluate_logical_coherence(sequence: str) -> int:
+def _technique_ids(techniques: List[str]) -> np.ndarray:
+    """Get the technique numbers (T1566.001 -> 1566) as an index array."""
+    return np.fromiter((int(t[1:5]) for t in techniques), dtype=np.intp, count=len(techniques))
+
+
+def get_tactic_orders(techniques: List[str]) -> np.ndarray:
+    """Get the kill-chain order of each technique as an int8 array (-1 if unknown)."""
+    return _TACTIC_LUT[_technique_ids(techniques)]
+
+
+def get_tactic_mask(techniques: List[str]) -> int:
+    """Get the set of tactics used by the techniques as a TACTIC_BIT mask."""
+    return int(np.bitwise_or.reduce(_TACTIC_BIT_LUT[_technique_ids(techniques)]))
+
+
+def _parse_techniques(techniques: List[str]) -> Tuple[np.ndarray, int]:
+    """Get both the tactic orders and the tactic mask from a single ID parse."""
+    technique_ids = _technique_ids(techniques)
+    return _TACTIC_LUT[technique_ids], int(np.bitwise_or.reduce(_TACTIC_BIT_LUT[technique_ids]))
+
+
+def _lc_score_py(order: np.ndarray) -> int:
+    """Score an int8 array of tactic orders, skipping unknowns (NumPy implementation)."""
+    order = order[order >= 0]
+    if not order.size:
+        return 5  # No known tactics, neutral score
+    
+    # Calculate ordering violations: going backwards costs 1, or 2 when the
+    # step back spans more than 3 tactics (major violation)
+    diffs = np.subtract(order[:-1], order[1:], dtype=np.int16)
+    violations = int(np.count_nonzero(diffs > 0) + np.count_nonzero(diffs > 3))
+    
+    # Calculate score based on violations
+    max_violations = len(order)
+    return LC_SCORES[np.searchsorted(max_violations * LC_VIOLATION_CUTOFFS, violations)]
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _lc_score(order):
+        """Score an int8 array of tactic orders, skipping unknowns (compiled implementation)."""
+        violations = 0
+        known = 0
+        previous = -1
+        for i in range(order.shape[0]):
+            current = int(order[i])
+            if current < 0:
+                continue
+            if known:
+                diff = previous - current
+                if diff > 3:
+                    violations += 2  # Major violation
+                elif diff > 0:
+                    violations += 1  # Minor violation
+            previous = current
+            known += 1
+        
+        if not known:
+            return 5  # No known tactics, neutral score
+        
+        max_violations = known
+        if violations == 0:
+            return 10
+        elif violations <= max_violations * 0.1:
+            return 9
+        elif violations <= max_violations * 0.2:
+            return 8
+        elif violations <= max_violations * 0.3:
+            return 7
+        elif violations <= max_violations * 0.4:
+            return 6
+        elif violations <= max_violations * 0.5:
+            return 5
+        elif violations <= max_violations * 0.7:
+            return 4
+        elif violations <= max_violations * 0.85:
+            return 3
+        return 2
+else:
+    _lc_score = _lc_score_py
+
+
+def evaluate_logical_coherence(techniques: List[str]) -> int:
     """
     Evaluate logical coherence of a technique sequence.
+    Takes the techniques returned by extract_techniques().
     Returns score 1-10 based on tactic ordering.
     """
-    techniques = extract_techniques(sequence)
-    if not techniques:
+    return _score_logical_coherence(get_tactic_orders(techniques))
+
+
+def _score_logical_coherence(tactic_orders: np.ndarray) -> int:
+    """Logical coherence from the per-technique tactic orders."""
+    if not tactic_orders.size:
         return 1
     
-    # Get tactic sequence
-    tactics = [get_tactic_for_technique(t) for t in techniques]
-    tactic_order_values = [TACTIC_ORDER.get(t, -1) for t in tactics if t != 'unknown']
-    
-    if not tactic_order_values:
-        return 5  # No known tactics, neutral score
-    
-    # Calculate ordering violations
-    violations = 0
-    for i in range(len(tactic_order_values) - 1):
-        if tactic_order_values[i] > tactic_order_values[i + 1]:
-            # Check if it's a major violation (e.g., going backwards significantly)
-            diff = tactic_order_values[i] - tactic_order_values[i + 1]
-            if diff > 3:
-                violations += 2  # Major violation
-            else:
-                violations += 1  # Minor violation
-    
-    # Calculate score based on violations
-    max_violations = len(tactic_order_values)
-    if violations == 0:
-        score = 10
-    elif violations <= max_violations * 0.1:
-        score = 9
-    elif violations <= max_violations * 0.2:
-        score = 8
-    elif violations <= max_violations * 0.3:
-        score = 7
-    elif violations <= max_violations * 0.4:
-        score = 6
-    elif violations <= max_violations * 0.5:
-        score = 5
-    elif violations <= max_violations * 0.7:
-        score = 4
-    elif violations <= max_violations * 0.85:
-        score = 3
-    else:
-        score = 2
-    
-    return max(1, min(10, score))
+    # Unknown techniques (-1) are skipped by the scoring kernel
+    return int(_lc_score(tactic_orders))
 
 
-def evaluate_operational_realism(sequence: str, apt_name: str) -> int:
+def evaluate_operational_realism(techniques: List[str], apt_name: str) -> int:
     """
     Evaluate operational realism of a technique sequence.
+    Takes the techniques returned by extract_techniques().
     Returns score 1-10 based on technique plausibility and APT context.
     """
-    techniques = extract_techniques(sequence)
-    if not techniques:
+    return _score_operational_realism(len(techniques), get_tactic_mask(techniques), apt_name)
+
+
+def _score_operational_realism(seq_length: int, tactics: int, apt_name: str) -> int:
+    """Operational realism from the technique count and TACTIC_BIT mask."""
+    if not seq_length:
         return 1
     
     # Base score
     score = 7
     
     # Check sequence length (realistic sequences are typically 8-25 techniques)
-    seq_length = len(techniques)
     if seq_length < 5:
         score -= 2  # Too short
     elif seq_length > 40:
@@ -256,15 +384,13 @@ def evaluate_operational_realism(sequence: str, apt_name: str) -> int:
         score += 1  # Ideal length
     
     # Check for essential tactics presence
-    tactics = set(get_tactic_for_technique(t) for t in techniques)
-    
     # Most realistic attacks have initial access, execution, and at least one of: persistence, discovery, or c2
     essential_present = 0
-    if 'initial-access' in tactics or 'reconnaissance' in tactics:
+    if tactics & _INITIAL_ACCESS_BITS:
         essential_present += 1
-    if 'execution' in tactics:
+    if tactics & _EXECUTION_BIT:
         essential_present += 1
-    if 'command-and-control' in tactics or 'persistence' in tactics:
+    if tactics & _FOOTHOLD_BITS:
         essential_present += 1
     
     if essential_present >= 2:
@@ -275,126 +401,232 @@ def evaluate_operational_realism(sequence: str, apt_name: str) -> int:
         score -= 2
     
     # Check for unrealistic patterns
-    if 'impact' in tactics and 'collection' not in tactics and 'exfiltration' not in tactics:
+    if tactics & _IMPACT_BIT and not tactics & _DATA_THEFT_BITS:
         # Impact without collection/exfiltration (unless it's a destructive APT)
-        if apt_name not in ['Sandworm_Team', 'Wizard_Spider', 'Lazarus_Group']:
+        if apt_name not in DESTRUCTIVE_APTS:
             score -= 1
     
     return max(1, min(10, score))
 
 
-def infer_objective_from_sequence(sequence: str) -> List[str]:
-    """Infer the primary objective from a technique sequence."""
-    techniques = extract_techniques(sequence)
-    tactics = [get_tactic_for_technique(t) for t in techniques]
-    tactic_set = set(tactics)
-    
-    objectives = []
+def infer_objective_from_sequence(techniques: List[str]) -> FrozenSet[str]:
+    """Infer the primary objective from a sequence's extracted techniques."""
+    return _objectives_from_mask(get_tactic_mask(techniques))
+
+
+def _objectives_from_mask(tactics: int) -> FrozenSet[str]:
+    """Infer objectives from a TACTIC_BIT mask."""
+    objectives = set()
     
     # Espionage indicators
-    if 'exfiltration' in tactic_set or 'collection' in tactic_set:
-        objectives.append('espionage')
+    if tactics & _DATA_THEFT_BITS:
+        objectives.add('espionage')
     
     # Financial indicators (less specific, needs context)
-    if 'credential-access' in tactic_set and 'lateral-movement' in tactic_set:
-        objectives.append('financial-gain')
-        objectives.append('credential-theft')
+    if tactics & _CREDENTIAL_ACCESS_BIT and tactics & _LATERAL_MOVEMENT_BIT:
+        objectives.update(('financial-gain', 'credential-theft'))
     
     # Ransomware/Disruption indicators
-    if 'impact' in tactic_set:
-        objectives.append('disruption')
-        objectives.append('ransomware')
+    if tactics & _IMPACT_BIT:
+        objectives.update(('disruption', 'ransomware'))
     
     # Credential harvesting
-    if 'credential-access' in tactic_set:
-        objectives.append('credential-harvesting')
-        objectives.append('credential-theft')
+    if tactics & _CREDENTIAL_ACCESS_BIT:
+        objectives.update(('credential-harvesting', 'credential-theft'))
     
     # If no clear objective, assume espionage (most common)
     if not objectives:
-        objectives.append('espionage')
+        objectives.add('espionage')
     
-    return objectives
+    return frozenset(objectives)
 
 
-def evaluate_same_objective(seed_sequence: str, candidate_sequence: str, apt_name: str) -> str:
+@functools.lru_cache(maxsize=1024)
+def _sequence_objectives(sequence: str) -> FrozenSet[str]:
+    """Infer objectives straight from a sequence string, memoized for repeated seeds."""
+    return infer_objective_from_sequence(extract_techniques(sequence))
+
+
+def _same_objective(seed_objectives: FrozenSet[str], candidate_objectives: FrozenSet[str],
+                    apt_objectives: FrozenSet[str]) -> str:
+    """Compare inferred seed and candidate objectives; returns 'Yes' or 'No'."""
+    # If candidate shares any objective with seed, return Yes
+    if seed_objectives & candidate_objectives:
+        return 'Yes'
+    
+    # If both align with APT's known objectives, return Yes
+    if (seed_objectives & apt_objectives) and (candidate_objectives & apt_objectives):
+        return 'Yes'
+    
+    # Otherwise, check if objectives are compatible
+    if any(seed_objectives & group and candidate_objectives & group for group in _COMPATIBLE_GROUPS):
+        return 'Yes'
+    
+    return 'No'
+
+
+def evaluate_same_objective(seed_objectives: FrozenSet[str], candidate_techniques: List[str], apt_name: str) -> str:
     """
     Determine if candidate shares same objective as seed.
+    Takes the seed's inferred objectives (computed once per row) and the
+    candidate's techniques as returned by extract_techniques().
     Returns 'Yes' or 'No'.
     """
-    if pd.isna(candidate_sequence) or candidate_sequence == '':
-        return 'No'
+    return _same_objective(
+        seed_objectives,
+        infer_objective_from_sequence(candidate_techniques),
+        APT_OBJECTIVES.get(apt_name, DEFAULT_APT_OBJECTIVES),
+    )
+
+
+def _evaluate_row(row: Tuple) -> Tuple[List, List, List]:
+    """
+    Evaluate C1-C6 of a single row given as (apt, seed_sequence, C1, ..., C6),
+    where each candidate is its extracted technique list, or None if missing.
+    Returns the LC scores, OR scores and SO results, one entry per candidate
+    (None for missing candidates).
+    """
+    apt_name, seed_sequence, *candidates = row
     
-    # Get objectives for both sequences
-    seed_objectives = infer_objective_from_sequence(seed_sequence)
-    candidate_objectives = infer_objective_from_sequence(candidate_sequence)
+    # Seed and APT context is the same for every candidate in the row
+    seed_objectives = _sequence_objectives(seed_sequence)
+    apt_objectives = APT_OBJECTIVES.get(apt_name, DEFAULT_APT_OBJECTIVES)
     
-    # Get APT's known objectives
-    apt_objectives = APT_OBJECTIVES.get(apt_name, ['espionage'])
+    lc_scores = [None] * len(candidates)
+    or_scores = [None] * len(candidates)
+    so_results = [None] * len(candidates)
     
-    # Check if there's overlap between seed and candidate objectives
-    seed_set = set(seed_objectives)
-    candidate_set = set(candidate_objectives)
-    apt_set = set(apt_objectives)
+    for i, candidate_techniques in enumerate(candidates):
+        # Skip if candidate doesn't exist
+        if candidate_techniques is None:
+            continue
+        
+        # Map techniques to tactics once for all three criteria
+        tactic_orders, tactics = _parse_techniques(candidate_techniques)
+        
+        # Evaluate Logical Coherence
+        lc_scores[i] = _score_logical_coherence(tactic_orders)
+        
+        # Evaluate Operational Realism
+        or_scores[i] = _score_operational_realism(len(candidate_techniques), tactics, apt_name)
+        
+        # Evaluate Same Objective
+        candidate_objectives = _objectives_from_mask(tactics)
+        so_results[i] = _same_objective(seed_objectives, candidate_objectives, apt_objectives)
     
-    # If candidate shares any objective with seed, return Yes
-    if seed_set & candidate_set:
-        return 'Yes'
+    return lc_scores, or_scores, so_results
+
+
+def _collect_results(results, total: int) -> List:
+    """Collect row results, logging a progress line every PROGRESS_INTERVAL rows."""
+    logger = logging.getLogger(__name__)
+    collected = []
+    for result in results:
+        collected.append(result)
+        if len(collected) % PROGRESS_INTERVAL == 0:
+            logger.info(f"Scored {len(collected)}/{total} variants")
+    return collected
+
+
+def evaluate_candidates(df: pd.DataFrame, max_workers: int = None) -> pd.DataFrame:
+    """
+    Evaluate all candidates in the dataframe.
+    max_workers limits the worker processes used for large inputs
+    (default: CPU count; 1 always scores in this process).
+    """
+    logger = logging.getLogger(__name__)
     
-    # If both align with APT's known objectives, return Yes
-    if (seed_set & apt_set) and (candidate_set & apt_set):
-        return 'Yes'
+    # Normalize missing sequences to '' in one pass so scoring only sees strings
+    sequence_cols = ['seed_set_enriched'] + [f'C{i}_enriched' for i in range(1, 7)]
+    sequences = df[sequence_cols].fillna('').astype(str)
     
-    # Otherwise, check if objectives are compatible
-    # E.g., espionage and credential-theft are compatible
-    compatible_groups = [
-        {'espionage', 'credential-theft', 'credential-harvesting'},
-        {'financial-gain', 'financial-theft', 'credential-theft'},
-        {'disruption', 'ransomware', 'ics-disruption'},
-    ]
+    # Extract candidate techniques column by column; missing candidates become None
+    for col in sequence_cols[1:]:
+        present = sequences[col] != ''
+        sequences[col] = sequences[col].str.findall(_TECH_RE).where(present, None)
+    sequences.insert(0, 'apt', df['apt'])
     
-    for group in compatible_groups:
-        if (seed_set & group) and (candidate_set & group):
-            return 'Yes'
+    # Plain (apt, seed, C1, ..., C6) tuples; no per-row Series or namedtuple
+    rows = list(sequences.itertuples(index=False, name=None))
     
-    return 'No'
+    # Rows are independent, so large inputs are scored in worker processes
+    if len(rows) >= PARALLEL_MIN_ROWS and max_workers != 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = _collect_results(executor.map(_evaluate_row, rows, chunksize=64), len(rows))
+    else:
+        results = _collect_results(map(_evaluate_row, rows), len(rows))
+    
+    # One log line per row rather than per candidate
+    if logger.isEnabledFor(logging.DEBUG):
+        for apt_name, variant, (lc_scores, or_scores, so_results) in zip(df['apt'], df['variant'], results):
+            scored = ', '.join(
+                f"C{i + 1} (LC={lc_scores[i]}, OR={or_scores[i]}, SO={so_results[i]})"
+                for i in range(6) if lc_scores[i] is not None
+            )
+            logger.debug(f"Processed: {apt_name} - {variant} - {scored}")
+    
+    # Write each metric as a C1-C6 block rather than cell by cell
+    for pos, metric, dtype in ((0, 'LC', 'float64'), (1, 'OR', 'float64'), (2, 'SO', 'object')):
+        cols = [f'C{i}_{metric}' for i in range(1, 7)]
+        df[cols] = pd.DataFrame([r[pos] for r in results], index=df.index, columns=cols, dtype=dtype)
+    
+    return df
 
 
-def evaluate_candidates(df: pd.DataFrame) -> pd.DataFrame:
-    """Evaluate all candidates in the dataframe."""
+def load_judgements(input_file: str, chunksize: int = None):
+    """
+    Load the raw Judgements sheet from the input workbook.
+    Uses the calamine engine when available and keeps a Parquet copy next to
+    the workbook so later runs can skip parsing the XLSX while it is unchanged.
+    A flattened CSV is read directly with compact dtypes, using the
+    multithreaded pyarrow parser when available; with chunksize it is
+    returned as an iterator of DataFrames instead of a single DataFrame.
+    """
     logger = logging.getLogger(__name__)
     
-    for idx, row in df.iterrows():
-        apt_name = row['apt']
-        seed_sequence = row['seed_set_enriched']
-        
-        # Evaluate each candidate (C1-C6)
-        for i in range(1, 7):
-            candidate_col = f'C{i}_enriched'
-            candidate_sequence = row[candidate_col]
-            
-            # Skip if candidate doesn't exist
-            if pd.isna(candidate_sequence) or candidate_sequence == '':
-                df.at[idx, f'C{i}_LC'] = None
-                df.at[idx, f'C{i}_OR'] = None
-                df.at[idx, f'C{i}_SO'] = None
-                continue
-            
-            # Evaluate Logical Coherence
-            lc_score = evaluate_logical_coherence(candidate_sequence)
-            df.at[idx, f'C{i}_LC'] = lc_score
-            
-            # Evaluate Operational Realism
-            or_score = evaluate_operational_realism(candidate_sequence, apt_name)
-            df.at[idx, f'C{i}_OR'] = or_score
-            
-            # Evaluate Same Objective
-            so_result = evaluate_same_objective(seed_sequence, candidate_sequence, apt_name)
-            df.at[idx, f'C{i}_SO'] = so_result
-            
-            logger.info(f"Processed: {apt_name} - {row['variant']} - C{i} (LC={lc_score}, OR={or_score}, SO={so_result})")
+    if input_file.endswith('.csv'):
+        if chunksize is None:
+            try:
+                return pd.read_csv(input_file, dtype=CSV_DTYPES, engine='pyarrow')
+            except (ImportError, ValueError):
+                pass  # pyarrow not installed or pandas < 1.4; use the default parser
+        return pd.read_csv(input_file, dtype=CSV_DTYPES, chunksize=chunksize)
+    
+    cache_file = os.path.splitext(input_file)[0] + '.parquet'
+    
+    # Raises FileNotFoundError for a missing workbook, even if a stale cache exists
+    input_mtime = os.path.getmtime(input_file)
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= input_mtime:
+        try:
+            return pd.read_parquet(cache_file)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache {cache_file}: {e}")
+    
+    read_kwargs = dict(sheet_name='Judgements', header=None, skiprows=2)
+    try:
+        df_raw = pd.read_excel(input_file, engine='calamine', **read_kwargs)
+    except (ImportError, ValueError):
+        # python-calamine not installed or pandas < 2.2; fall back to openpyxl
+        df_raw = pd.read_excel(input_file, **read_kwargs)
     
-    return df
+    # Parquet requires string column names; callers assign their own names anyway
+    try:
+        df_raw.set_axis(df_raw.columns.astype(str), axis=1).to_parquet(cache_file, index=False)
+    except Exception as e:
+        logger.debug(f"Could not write cache {cache_file}: {e}")
+    
+    return df_raw
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that need an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be an integer, got {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 
 def main():
@@ -406,12 +638,25 @@ def main():
     parser.add_argument(
         '-i', '--input',
         default='TE-E2-RESULTS-VALIDATION.xlsx',
-        help='Input Excel file (default: TE-E2-RESULTS-VALIDATION.xlsx)'
+        help='Input Excel file, or flattened CSV (default: TE-E2-RESULTS-VALIDATION.xlsx)'
     )
     parser.add_argument(
         '-o', '--output',
         default='TE-E2-RESULTS-VALIDATED-FLATTENED-COMPLETED.csv',
-        help='Output CSV file (default: TE-E2-RESULTS-VALIDATED-FLATTENED-COMPLETED.csv)'
+        help='Output CSV file, or Parquet if the name ends in .parquet '
+             '(default: TE-E2-RESULTS-VALIDATED-FLATTENED-COMPLETED.csv)'
+    )
+    parser.add_argument(
+        '--chunksize',
+        type=_positive_int,
+        default=None,
+        help='Process a CSV input this many rows at a time to limit memory use (CSV output only)'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=_positive_int,
+        default=None,
+        help=f'Worker processes for inputs of {PARALLEL_MIN_ROWS}+ rows (default: CPU count; 1 disables)'
     )
     parser.add_argument(
         '-v', '--verbose',
@@ -424,18 +669,28 @@ def main():
     # Set logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
+        _log_multi_tactic_techniques()
     
     logger = logging.getLogger(__name__)
+    
+    if args.chunksize and not args.input.endswith('.csv'):
+        logger.error("--chunksize requires CSV input")
+        sys.exit(1)
+    if args.chunksize and args.output.endswith('.parquet'):
+        logger.error("--chunksize requires CSV output")
+        sys.exit(1)
+    
     logger.info("Loading APT variants data...")
+    input_kind = 'CSV' if args.input.endswith('.csv') else 'Excel'
     
-    # Load the Excel file
+    # Load the Excel or CSV file
     try:
-        df_raw = pd.read_excel(args.input, sheet_name='Judgements', header=None, skiprows=2)
+        df_raw = load_judgements(args.input, chunksize=args.chunksize)
     except FileNotFoundError:
         logger.error(f"Input file not found: {args.input}")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Error loading Excel file: {e}")
+        logger.error(f"Error loading {input_kind} file: {e}")
         sys.exit(1)
     
     # Define column names
@@ -447,39 +702,66 @@ def main():
         'C1_SO', 'C2_SO', 'C3_SO', 'C4_SO', 'C5_SO', 'C6_SO'
     ]
     
-    df_raw.columns = columns
-    
-    logger.info(f"Loaded {len(df_raw)} APT variants")
-    logger.info("Evaluating candidates...")
+    lc_cols = [f'C{i}_LC' for i in range(1, 7)]
+    or_cols = [f'C{i}_OR' for i in range(1, 7)]
+    so_cols = [f'C{i}_SO' for i in range(1, 7)]
     
-    # Evaluate all candidates
-    df_evaluated = evaluate_candidates(df_raw)
+    # Compile the coherence kernel up front rather than on the first row
+    _lc_score(np.zeros(2, dtype=np.int8))
+    
+    # A single frame, or a stream of chunks for CSV input with --chunksize;
+    # each chunk is written as soon as it is scored and only its scores are kept
+    chunks = iter([df_raw] if isinstance(df_raw, pd.DataFrame) else df_raw)
+    score_frames = []
+    chunk_number = -1
+    while True:
+        # Chunks are read lazily, so parse errors can surface on any chunk
+        try:
+            df_chunk = next(chunks)
+        except StopIteration:
+            break
+        except Exception as e:
+            logger.error(f"Error loading {input_kind} file: {e}")
+            sys.exit(1)
+        chunk_number += 1
+        
+        df_chunk.columns = columns
+        
+        logger.info(f"Loaded {len(df_chunk)} APT variants")
+        logger.info("Evaluating candidates...")
+        
+        # Evaluate all candidates
+        df_evaluated = evaluate_candidates(df_chunk, max_workers=args.jobs)
+        
+        # Save to CSV (or Parquet, which writes faster and smaller for wide frames)
+        try:
+            if args.output.endswith('.parquet'):
+                df_evaluated.to_parquet(args.output, index=False)
+            else:
+                first = chunk_number == 0
+                df_evaluated.to_csv(args.output, index=False, mode='w' if first else 'a', header=first)
+        except Exception as e:
+            logger.error(f"Error saving output file: {e}")
+            sys.exit(1)
+        
+        score_frames.append(df_evaluated[lc_cols + or_cols + so_cols])
     
-    # Save to CSV
-    try:
-        df_evaluated.to_csv(args.output, index=False)
-        logger.info(f"\nEvaluation complete! Results saved to {args.output}")
-    except Exception as e:
-        logger.error(f"Error saving output file: {e}")
-        sys.exit(1)
+    df_evaluated = pd.concat(score_frames) if score_frames else pd.DataFrame(columns=lc_cols + or_cols + so_cols)
+    logger.info(f"\nEvaluation complete! Results saved to {args.output}")
     
     logger.info(f"\nSummary statistics:")
     logger.info(f"Total variants evaluated: {len(df_evaluated)}")
     
-    # Print average scores
-    lc_cols = [f'C{i}_LC' for i in range(1, 7)]
-    or_cols = [f'C{i}_OR' for i in range(1, 7)]
-    so_cols = [f'C{i}_SO' for i in range(1, 7)]
-    
-    logger.info(f"Average Logical Coherence: {df_evaluated[lc_cols].mean().mean():.2f}")
-    logger.info(f"Average Operational Realism: {df_evaluated[or_cols].mean().mean():.2f}")
+    # Grand mean and range over all scored candidates (not a mean of per-column means)
+    for label, cols in (('Logical Coherence', lc_cols), ('Operational Realism', or_cols)):
+        scores = pd.Series(df_evaluated[cols].to_numpy(dtype=np.float64).ravel()).dropna()
+        if scores.size:
+            logger.info(f"Average {label}: {scores.mean():.2f} (range {scores.min():.0f}-{scores.max():.0f})")
     
     # Count Yes/No for Same Objective
-    yes_count = 0
-    no_count = 0
-    for col in so_cols:
-        yes_count += (df_evaluated[col] == 'Yes').sum()
-        no_count += (df_evaluated[col] == 'No').sum()
+    so_values = df_evaluated[so_cols].to_numpy().ravel()
+    yes_count = int((so_values == 'Yes').sum())
+    no_count = int((so_values == 'No').sum())
     
     total_so = yes_count + no_count
     if total_so > 0: